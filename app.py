@@ -6,7 +6,16 @@ import requests
 import random
 import time
 import html
+import sys
 from datetime import datetime
+from biblioteca import (
+    COLUNAS_CANAIS, COLUNAS_VIRAIS, ESQUEMA_CANAIS, ESQUEMA_VIRAIS,
+    anexar_parquet, assinatura, ler_csv, ler_parquet, limpar_parquet, links_parquet, migrar_csv
+)
+from sessao import (
+    ResultadosSessao, anotar_indice, carregar_indice, dados_indice, ids_pendentes, indice_vazio,
+    mesclar_indices, podar_indice, registrar_consulta, registrar_no_indice, salvar_indice
+)
 
 # ============================================================
 # CONFIGURAÇÃO DA PÁGINA
@@ -20,6 +29,12 @@ st.set_page_config(
 
 ARQUIVO_SALVOS = "canais_salvos.csv"
 ARQUIVO_VIRAIS = "virais_salvos.csv"
+DIR_SALVOS_PARQUET = "canais_salvos_parquet"
+DIR_VIRAIS_PARQUET = "virais_salvos_parquet"
+MARCADOR_PARQUET = "biblioteca_parquet.ok"
+ARQUIVO_INDICE = "indice_resultados.jsonl"
+VALIDADE_INDICE = 6 * 60 * 60  # segundos até reconsultar estatísticas de um item já visto
+RETENCAO_INDICE = 7 * 24 * 60 * 60  # segundos até esquecer um item que não voltou a aparecer
 
 
 # ============================================================
@@ -222,16 +237,48 @@ aplicar_estilo_saas()
 
 
 # ============================================================
-# FUNÇÕES DE BANCO DE DADOS CSV
+# FUNÇÕES DE BANCO DE DADOS (CSV / PARQUET)
 # ============================================================
 
+def usar_parquet():
+    # O marcador só é criado depois que as duas bibliotecas foram migradas
+    return os.path.exists(MARCADOR_PARQUET)
+
+def migrar_biblioteca_para_parquet():
+    migrar_csv(ARQUIVO_SALVOS, DIR_SALVOS_PARQUET, ESQUEMA_CANAIS)
+    migrar_csv(ARQUIVO_VIRAIS, DIR_VIRAIS_PARQUET, ESQUEMA_VIRAIS)
+    open(MARCADOR_PARQUET, 'w').close()
+    # A partir daqui o Parquet é o único armazenamento; os CSVs ficam como backup
+    for arquivo in (ARQUIVO_SALVOS, ARQUIVO_VIRAIS):
+        if os.path.exists(arquivo): os.replace(arquivo, arquivo + ".migrado")
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def exportar_biblioteca(tabela, formato, versao):
+    # `versao` é a assinatura dos arquivos da biblioteca: só reserializa quando algo foi gravado
+    df = carregar_salvos() if tabela == "canais" else carregar_virais()
+    return df.to_parquet(index=False) if formato == "parquet" else df.to_csv(index=False).encode('utf-8')
+
+def versao_biblioteca(tabela):
+    if usar_parquet():
+        return assinatura(DIR_SALVOS_PARQUET if tabela == "canais" else DIR_VIRAIS_PARQUET)
+    return assinatura(ARQUIVO_SALVOS if tabela == "canais" else ARQUIVO_VIRAIS)
+
+def limpar_biblioteca(arquivo_csv, diretorio):
+    if usar_parquet(): limpar_parquet(diretorio)
+    elif os.path.exists(arquivo_csv): os.remove(arquivo_csv)
+
 def carregar_salvos():
-    colunas = ['Nome', 'Inscritos', 'Vídeos', 'Média Views', 'País', 'Criação', 'Dias Vida', 'Link', 'Data Descoberta']
+    if usar_parquet():
+        return ler_parquet(DIR_SALVOS_PARQUET, ESQUEMA_CANAIS)
     if not os.path.exists(ARQUIVO_SALVOS):
-        return pd.DataFrame(columns=colunas)
-    return pd.read_csv(ARQUIVO_SALVOS)
+        return pd.DataFrame(columns=COLUNAS_CANAIS)
+    return ler_csv(ARQUIVO_SALVOS, ESQUEMA_CANAIS)
 
 def salvar_canal(dados_canal):
+    if usar_parquet():
+        if dados_canal['Link'] in links_parquet(DIR_SALVOS_PARQUET, ESQUEMA_CANAIS): return False
+        anexar_parquet(DIR_SALVOS_PARQUET, ESQUEMA_CANAIS, pd.DataFrame([dados_canal]))
+        return True
     df = carregar_salvos()
     if dados_canal['Link'] not in df['Link'].values:
         linha_limpa = {k: v for k, v in dados_canal.items() if k in df.columns}
@@ -242,12 +289,17 @@ def salvar_canal(dados_canal):
     return False
 
 def carregar_virais():
-    colunas = ['Título', 'Canal', 'Views', 'Likes', 'Comentários', 'Publicado em', 'Link', 'Data Descoberta']
+    if usar_parquet():
+        return ler_parquet(DIR_VIRAIS_PARQUET, ESQUEMA_VIRAIS)
     if not os.path.exists(ARQUIVO_VIRAIS):
-        return pd.DataFrame(columns=colunas)
-    return pd.read_csv(ARQUIVO_VIRAIS)
+        return pd.DataFrame(columns=COLUNAS_VIRAIS)
+    return ler_csv(ARQUIVO_VIRAIS, ESQUEMA_VIRAIS)
 
 def salvar_viral(dados_viral):
+    if usar_parquet():
+        if dados_viral['Link'] in links_parquet(DIR_VIRAIS_PARQUET, ESQUEMA_VIRAIS): return False
+        anexar_parquet(DIR_VIRAIS_PARQUET, ESQUEMA_VIRAIS, pd.DataFrame([dados_viral]))
+        return True
     df = carregar_virais()
     if dados_viral['Link'] not in df['Link'].values:
         linha_limpa = {k: v for k, v in dados_viral.items() if k in df.columns}
@@ -258,6 +310,25 @@ def salvar_viral(dados_viral):
     return False
 
 
+# ============================================================
+# ÍNDICE GLOBAL DE RESULTADOS (ENTRE BUSCAS)
+# ============================================================
+
+def persistir_indice_se_ativo(tipo, alterados):
+    if not alterados or not st.session_state.get('persistir_indice'): return
+    try: anotar_indice(ARQUIVO_INDICE, tipo, alterados)
+    except Exception: pass
+
+def manter_indice():
+    # Poda por retenção no máximo uma vez por hora; o diário é reescrito só quando algo sai
+    agora = time.time()
+    if agora - st.session_state['indice_podado_em'] < 60 * 60: return
+    st.session_state['indice_podado_em'] = agora
+    if podar_indice(st.session_state['indice_global'], RETENCAO_INDICE, agora) and st.session_state.get('persistir_indice'):
+        try: salvar_indice(ARQUIVO_INDICE, st.session_state['indice_global'])
+        except Exception: pass
+
+
 # ============================================================
 # FUNÇÃO DE INTELIGÊNCIA DE NICHO
 # ============================================================
@@ -313,23 +384,43 @@ def executar_busca(api_key, query, max_results, duration, min_subs, max_subs, mi
         channel_ids = {item['snippet']['channelId'] for item in response.get('items', [])}
         if not channel_ids: return []
 
-        st.session_state['quota_usada'] += 1
-        request_channels = youtube.channels().list(id=','.join(list(channel_ids)), part='snippet,statistics')
-        channels_response = request_channels.execute()
+        indice = st.session_state['indice_global']['canais']
+        hoje = sys.intern(datetime.now().strftime("%Y-%m-%d"))
+        alterados = {}
+        manter_indice()
+        pendentes = ids_pendentes(indice, channel_ids, VALIDADE_INDICE)
+        if pendentes:
+            st.session_state['quota_usada'] += 1
+            request_channels = youtube.channels().list(id=','.join(pendentes), part='snippet,statistics')
+            channels_response = request_channels.execute()
+
+            for channel in channels_response.get('items', []):
+                stats = channel.get('statistics', {})
+                snippet = channel.get('snippet', {})
+                alterados[channel['id']] = registrar_no_indice(indice, channel['id'], [
+                    snippet.get('title', 'Canal sem nome'),
+                    int(stats.get('subscriberCount', 0)) if not stats.get('hiddenSubscriberCount') else 0,
+                    int(stats.get('videoCount', 0)),
+                    int(stats.get('viewCount', 0)),
+                    sys.intern(snippet.get('country', 'N/A')),
+                    snippet.get('publishedAt', '')[:10],
+                    snippet.get('thumbnails', {}).get('default', {}).get('url', '')
+                ], hoje)
+            # Canais que a API deixou de retornar (removidos ou privados) saem do índice
+            for channel_id in pendentes:
+                if channel_id not in alterados and indice.pop(channel_id, None) is not None:
+                    alterados[channel_id] = None
 
         novos = []
-        for channel in channels_response.get('items', []):
-            stats = channel.get('statistics', {})
-            snippet = channel.get('snippet', {})
-
-            subs = int(stats.get('subscriberCount', 0)) if not stats.get('hiddenSubscriberCount') else 0
-            vids = int(stats.get('videoCount', 0))
-            views_total = int(stats.get('viewCount', 0))
-            pais = snippet.get('country', 'N/A')
+        for channel_id in channel_ids:
+            entrada = indice.get(channel_id)
+            if not entrada: continue
+            if registrar_consulta(entrada, query): alterados[channel_id] = entrada
+            dados = dados_indice('canais', entrada)
+            subs, vids, views_total = dados['Inscritos'], dados['Vídeos'], dados['Total Views']
 
             try:
-                raw_date = snippet['publishedAt']
-                data_criacao_obj = datetime.strptime(raw_date[:10], "%Y-%m-%d")
+                data_criacao_obj = datetime.strptime(dados['Criado'], "%Y-%m-%d")
                 data_formatada = data_criacao_obj.strftime("%d/%m/%Y")
                 dias_de_vida = (datetime.now() - data_criacao_obj).days
             except Exception:
@@ -338,14 +429,15 @@ def executar_busca(api_key, query, max_results, duration, min_subs, max_subs, mi
             if min_subs <= subs <= max_subs and min_videos <= vids <= max_videos:
                 media_views = int(views_total / vids) if vids > 0 else 0
                 novos.append({
-                    'Nome': snippet.get('title', 'Canal sem nome'), 'Inscritos': subs, 'Vídeos': vids,
-                    'Total Views': views_total, 'Média Views': media_views, 'País': pais,
+                    'Nome': dados['Nome'], 'Inscritos': subs, 'Vídeos': vids,
+                    'Total Views': views_total, 'Média Views': media_views, 'País': dados['País'],
                     'Criação': data_formatada, 'Dias Vida': dias_de_vida,
-                    'Link': f"https://www.youtube.com/channel/{channel['id']}",
-                    'Data Descoberta': datetime.now().strftime("%Y-%m-%d"),
-                    'Thumb': snippet.get('thumbnails', {}).get('default', {}).get('url', ''),
-                    'Desc': snippet.get('description', '')[:100] + "..."
+                    'Link': f"https://www.youtube.com/channel/{channel_id}",
+                    'Data Descoberta': entrada[1],
+                    'Thumb': dados['Thumb'],
+                    'Consultas': ", ".join(entrada[2])
                 })
+        persistir_indice_se_ativo('canais', alterados)
         return novos
     except Exception as e:
         st.error(f"Erro na API: {e}")
@@ -375,31 +467,47 @@ def executar_busca_virais(api_key, query, max_results, min_views, max_views, reg
         video_ids = [item['id']['videoId'] for item in response.get('items', []) if item.get('id', {}).get('videoId')]
         if not video_ids: return []
 
-        st.session_state['quota_usada'] += 1 
-        request_videos = youtube.videos().list(id=','.join(video_ids), part='snippet,statistics')
-        videos_response = request_videos.execute()
+        indice = st.session_state['indice_global']['videos']
+        hoje = sys.intern(datetime.now().strftime("%Y-%m-%d"))
+        alterados = {}
+        manter_indice()
+        pendentes = ids_pendentes(indice, video_ids, VALIDADE_INDICE)
+        if pendentes:
+            st.session_state['quota_usada'] += 1 
+            request_videos = youtube.videos().list(id=','.join(pendentes), part='snippet,statistics')
+            videos_response = request_videos.execute()
+
+            for video in videos_response.get('items', []):
+                stats = video.get('statistics', {})
+                snippet = video.get('snippet', {})
+                alterados[video['id']] = registrar_no_indice(indice, video['id'], [
+                    snippet.get('title', 'Sem título'),
+                    sys.intern(snippet.get('channelTitle', 'Desconhecido')),
+                    int(stats.get('viewCount', 0)),
+                    int(stats.get('likeCount', 0)),
+                    int(stats.get('commentCount', 0)),
+                    snippet.get('publishedAt', '')[:10]
+                ], hoje)
+            for video_id in pendentes:
+                if video_id not in alterados and indice.pop(video_id, None) is not None:
+                    alterados[video_id] = None
         
         novos = []
-        for video in videos_response.get('items', []):
-            stats = video.get('statistics', {})
-            snippet = video.get('snippet', {})
+        for video_id in video_ids:
+            entrada = indice.get(video_id)
+            if not entrada: continue
+            if registrar_consulta(entrada, query): alterados[video_id] = entrada
+            dados = dados_indice('videos', entrada)
             
-            views = int(stats.get('viewCount', 0))
-            likes = int(stats.get('likeCount', 0))
-            comments = int(stats.get('commentCount', 0))
-            
-            if min_views <= views <= max_views:
+            if min_views <= dados['Views'] <= max_views:
                 novos.append({
-                    'Título': snippet.get('title', 'Sem título'),
-                    'Canal': snippet.get('channelTitle', 'Desconhecido'),
-                    'Views': views,
-                    'Likes': likes,
-                    'Comentários': comments,
-                    'Publicado em': snippet.get('publishedAt', '')[:10],
-                    'Link': f"https://www.youtube.com/watch?v={video['id']}",
-                    'Data Descoberta': datetime.now().strftime("%Y-%m-%d"),
-                    'Thumb': snippet.get('thumbnails', {}).get('medium', {}).get('url', '')
+                    **dados,
+                    'Link': f"https://www.youtube.com/watch?v={video_id}",
+                    'Data Descoberta': entrada[1],
+                    'Thumb': f"https://i.ytimg.com/vi/{video_id}/mqdefault.jpg",
+                    'Consultas': ", ".join(entrada[2])
                 })
+        persistir_indice_se_ativo('videos', alterados)
         return novos
     except Exception as e:
         st.error(f"Erro na API: {e}")
@@ -432,13 +540,16 @@ def section_header(title, caption):
 
 valores_iniciais = {
     'quota_usada': 0,
-    'resultados_busca': [],
+    'resultados_busca': ResultadosSessao(),
     'next_page_token': None,
     'termo_atual': "",
-    'resultados_virais': [],
+    'resultados_virais': ResultadosSessao(),
     'next_page_token_virais': None,
     'termo_atual_viral': "",
-    'sugestoes_cache': []
+    'sugestoes_cache': [],
+    'indice_global': indice_vazio(),
+    'indice_carregado': False,
+    'indice_podado_em': 0
 }
 
 for chave, valor in valores_iniciais.items():
@@ -468,6 +579,43 @@ with st.sidebar:
     st.caption("Use a região para priorizar canais de um país específico.")
     st.markdown("---")
 
+    if usar_parquet():
+        st.caption("💾 Biblioteca armazenada em Parquet.")
+    elif not st.session_state.get('confirmar_migracao'):
+        st.caption("💾 Biblioteca armazenada em CSV.")
+        if st.button("Migrar para Parquet", use_container_width=True, help="Parquet mantém colunas tipadas e grava uma partição por Data Descoberta."):
+            st.session_state['confirmar_migracao'] = True
+            st.rerun()
+    else:
+        st.warning("A migração é definitiva: depois dela a biblioteca passa a usar só Parquet e os CSVs ficam como backup (.migrado).")
+        col_sim, col_nao = st.columns(2)
+        if col_sim.button("Confirmar", type="primary", use_container_width=True):
+            try:
+                migrar_biblioteca_para_parquet()
+                st.session_state['confirmar_migracao'] = False
+                st.rerun()
+            except Exception as e:
+                st.error(f"Falha na migração, a biblioteca continua em CSV: {e}")
+        if col_nao.button("Cancelar", use_container_width=True):
+            st.session_state['confirmar_migracao'] = False
+            st.rerun()
+
+    if st.checkbox("Lembrar resultados entre sessões", key="persistir_indice", help="Guarda o índice de canais e vídeos já vistos em disco."):
+        if not st.session_state['indice_carregado']:
+            try:
+                indice_disco = carregar_indice(ARQUIVO_INDICE, RETENCAO_INDICE)
+                if any(st.session_state['indice_global'].values()):
+                    mesclar_indices(indice_disco, st.session_state['indice_global'])
+                    salvar_indice(ARQUIVO_INDICE, indice_disco)
+                st.session_state['indice_global'] = indice_disco
+            except OSError as e:
+                st.warning(f"Não foi possível ler o índice salvo: {e}")
+            st.session_state['indice_carregado'] = True
+    st.checkbox("Acumular resultados entre buscas", key="acumular_resultados", help="Novas buscas e a aba de nichos somam aos resultados atuais em vez de substituí-los.")
+    indice_atual = st.session_state['indice_global']
+    st.caption(f"🧠 Índice: {len(indice_atual['canais'])} canais e {len(indice_atual['videos'])} vídeos já vistos.")
+    st.markdown("---")
+
     st.markdown("""
     <div class="sidebar-tip">
         Dica: filtros muito restritos podem retornar poucos canais. Comece amplo e depois refine.
@@ -521,10 +669,11 @@ with tab_busca:
         if col_btn1.button("🔍 Buscar Canais", type="primary", use_container_width=True):
             if api_key:
                 with st.spinner("Analisando o YouTube..."):
-                    st.session_state['resultados_busca'] = []
+                    if not st.session_state['acumular_resultados']: st.session_state['resultados_busca'].limpar()
                     st.session_state['next_page_token'] = None
                     res = executar_busca(api_key, query, max_results, mapa_dur[duracao], min_subs, max_subs, min_videos, max_videos, region_param, False)
-                    st.session_state['resultados_busca'] = res
+                    st.session_state['resultados_busca'].atualizar(res)
+                    st.session_state['resultados_busca'].adicionar(res)
                     if not res: st.warning("Nenhum canal atendeu aos filtros atuais.")
             else: st.error("Configure sua API Key nas Settings da barra lateral.")
 
@@ -534,16 +683,18 @@ with tab_busca:
                     if api_key:
                         with st.spinner("Cavando mais fundo..."):
                             res = executar_busca(api_key, st.session_state['termo_atual'], max_results, mapa_dur[duracao], min_subs, max_subs, min_videos, max_videos, region_param, True)
-                            links_existentes = {c['Link'] for c in st.session_state['resultados_busca']}
-                            novos = [c for c in res if c['Link'] not in links_existentes]
-                            st.session_state['resultados_busca'].extend(novos)
-                            if novos: st.toast(f"✅ {len(novos)} novos canais adicionados!")
+                            st.session_state['resultados_busca'].atualizar(res)
+                            novos = st.session_state['resultados_busca'].adicionar(res)
+                            if novos: st.toast(f"✅ {novos} novos canais adicionados!")
                             else: st.toast("Nenhum canal novo nesta página.")
             else: col_btn2.info("🏁 Varredura completa para este termo.")
 
     # EXIBIÇÃO CANAIS
     if st.session_state['resultados_busca']:
         st.markdown(f"### 📋 Canais Encontrados ({len(st.session_state['resultados_busca'])})")
+        e1, e2 = st.columns(2)
+        e1.download_button("📥 Exportar Resultados CSV", st.session_state['resultados_busca'].exportar("csv"), "resultados_canais.csv", "text/csv", use_container_width=True)
+        e2.download_button("📥 Exportar Resultados Parquet", st.session_state['resultados_busca'].exportar("parquet"), "resultados_canais.parquet", "application/octet-stream", use_container_width=True)
         
         for i, canal in enumerate(st.session_state['resultados_busca']):
             is_viral = canal['Média Views'] > canal['Inscritos']
@@ -561,6 +712,7 @@ with tab_busca:
                     if canal_novo: st.markdown(f"""<span class="badge badge-green">🚀 Promessa: {canal['Dias Vida']} dias</span>""", unsafe_allow_html=True)
                     else: st.markdown(f"""<span class="badge">📅 Ativo há {canal['Dias Vida']} dias</span>""", unsafe_allow_html=True)
                     st.caption(f"📍 Região: {canal['País']} · Criado em {canal['Criação']}")
+                    if canal.get('Consultas'): st.caption(f"🔎 Encontrado em: {canal['Consultas']}")
                 with col_metrics:
                     st.markdown(f"👤 **{formatar_numero(canal['Inscritos'])}** inscritos")
                     st.markdown(f"🎥 **{formatar_numero(canal['Vídeos'])}** vídeos")
@@ -596,10 +748,11 @@ with tab_virais:
         if col_btn1.button("🎬 Buscar Virais", type="primary", use_container_width=True):
             if api_key:
                 with st.spinner("Buscando sucessos do YouTube..."):
-                    st.session_state['resultados_virais'] = []
+                    if not st.session_state['acumular_resultados']: st.session_state['resultados_virais'].limpar()
                     st.session_state['next_page_token_virais'] = None
                     res = executar_busca_virais(api_key, query_viral, max_results_viral, min_views, max_views, region_param, mapa_dur_viral[duracao_viral], False)
-                    st.session_state['resultados_virais'] = res
+                    st.session_state['resultados_virais'].atualizar(res)
+                    st.session_state['resultados_virais'].adicionar(res)
                     if not res: st.warning("Nenhum vídeo com essa quantidade de views foi encontrado.")
             else: st.error("Configure sua API Key nas Settings da barra lateral.")
 
@@ -609,16 +762,18 @@ with tab_virais:
                     if api_key:
                         with st.spinner("Buscando mais sucessos..."):
                             res = executar_busca_virais(api_key, st.session_state['termo_atual_viral'], max_results_viral, min_views, max_views, region_param, mapa_dur_viral[duracao_viral], True)
-                            links_existentes = {c['Link'] for c in st.session_state['resultados_virais']}
-                            novos = [c for c in res if c['Link'] not in links_existentes]
-                            st.session_state['resultados_virais'].extend(novos)
-                            if novos: st.toast(f"✅ {len(novos)} novos vídeos adicionados!")
+                            st.session_state['resultados_virais'].atualizar(res)
+                            novos = st.session_state['resultados_virais'].adicionar(res)
+                            if novos: st.toast(f"✅ {novos} novos vídeos adicionados!")
                             else: st.toast("Nenhum vídeo novo nesta página atendeu aos filtros.")
             else: col_btn2.info("🏁 Varredura completa para este termo.")
 
     # EXIBIÇÃO VIRAIS
     if st.session_state['resultados_virais']:
         st.markdown(f"### 🚀 Vídeos Encontrados ({len(st.session_state['resultados_virais'])})")
+        e1, e2 = st.columns(2)
+        e1.download_button("📥 Exportar Resultados CSV", st.session_state['resultados_virais'].exportar("csv"), "resultados_virais.csv", "text/csv", use_container_width=True)
+        e2.download_button("📥 Exportar Resultados Parquet", st.session_state['resultados_virais'].exportar("parquet"), "resultados_virais.parquet", "application/octet-stream", use_container_width=True)
         
         for i, video in enumerate(st.session_state['resultados_virais']):
             titulo_seguro = html.escape(str(video['Título']))
@@ -633,6 +788,7 @@ with tab_virais:
                     st.markdown(f"""<div class="channel-title"><a href="{link_seguro}" target="_blank">{titulo_seguro}</a></div>""", unsafe_allow_html=True)
                     st.markdown(f"""<span class="badge badge-purple">👤 Canal: {html.escape(str(video['Canal']))}</span>""", unsafe_allow_html=True)
                     st.caption(f"📅 Publicado em: {video['Publicado em']}")
+                    if video.get('Consultas'): st.caption(f"🔎 Encontrado em: {video['Consultas']}")
                 with col_metrics:
                     st.markdown(f"👁️ :green[**{formatar_numero(video['Views'])}**] views")
                     st.markdown(f"👍 **{formatar_numero(video['Likes'])}** likes")
@@ -666,10 +822,11 @@ with tab_discovery:
                 if cols[i % 3].button(f"🔍 {sug}", key=f"nicho_{i}", use_container_width=True):
                     if api_key:
                         with st.spinner(f"Investigando '{sug}'..."):
-                            st.session_state['resultados_busca'] = []
+                            if not st.session_state['acumular_resultados']: st.session_state['resultados_busca'].limpar()
                             st.session_state['next_page_token'] = None
                             res = executar_busca(api_key, sug, 50, "medium", 1000, 10000000, 1, 50, region_param, False)
-                            st.session_state['resultados_busca'] = res
+                            st.session_state['resultados_busca'].atualizar(res)
+                            st.session_state['resultados_busca'].adicionar(res)
                             st.success("Busca concluída! Volte à aba 'Motor de Busca' para ver os resultados.")
                     else: st.error("Configure sua API Key.")
 
@@ -686,10 +843,11 @@ with tab_salvos:
         if not df_canais.empty:
             st.data_editor(df_canais, column_config={"Link": st.column_config.LinkColumn("Canal")}, hide_index=True, use_container_width=True)
             st.markdown("<br>", unsafe_allow_html=True)
-            c1, c2 = st.columns(2)
-            c1.download_button("📥 Exportar Canais CSV", df_canais.to_csv(index=False).encode('utf-8'), "outliers_canais.csv", "text/csv", use_container_width=True)
-            if c2.button("🗑️ Limpar Canais", use_container_width=True):
-                os.remove(ARQUIVO_SALVOS)
+            c1, c2, c3 = st.columns(3)
+            c1.download_button("📥 Exportar Canais CSV", exportar_biblioteca("canais", "csv", versao_biblioteca("canais")), "outliers_canais.csv", "text/csv", use_container_width=True)
+            c2.download_button("📥 Exportar Canais Parquet", exportar_biblioteca("canais", "parquet", versao_biblioteca("canais")), "outliers_canais.parquet", "application/octet-stream", use_container_width=True)
+            if c3.button("🗑️ Limpar Canais", use_container_width=True):
+                limpar_biblioteca(ARQUIVO_SALVOS, DIR_SALVOS_PARQUET)
                 st.rerun()
         else: st.info("Nenhum canal salvo.")
 
@@ -698,9 +856,10 @@ with tab_salvos:
         if not df_virais.empty:
             st.data_editor(df_virais, column_config={"Link": st.column_config.LinkColumn("Vídeo")}, hide_index=True, use_container_width=True)
             st.markdown("<br>", unsafe_allow_html=True)
-            c3, c4 = st.columns(2)
-            c3.download_button("📥 Exportar Vídeos CSV", df_virais.to_csv(index=False).encode('utf-8'), "outliers_virais.csv", "text/csv", use_container_width=True)
-            if c4.button("🗑️ Limpar Vídeos", use_container_width=True):
-                os.remove(ARQUIVO_VIRAIS)
+            c4, c5, c6 = st.columns(3)
+            c4.download_button("📥 Exportar Vídeos CSV", exportar_biblioteca("virais", "csv", versao_biblioteca("virais")), "outliers_virais.csv", "text/csv", use_container_width=True)
+            c5.download_button("📥 Exportar Vídeos Parquet", exportar_biblioteca("virais", "parquet", versao_biblioteca("virais")), "outliers_virais.parquet", "application/octet-stream", use_container_width=True)
+            if c6.button("🗑️ Limpar Vídeos", use_container_width=True):
+                limpar_biblioteca(ARQUIVO_VIRAIS, DIR_VIRAIS_PARQUET)
                 st.rerun()
         else: st.info("Nenhum vídeo salvo.")
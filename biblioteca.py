@@ -0,0 +1,109 @@
+import os
+import shutil
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
+
+# ============================================================
+# ESQUEMAS DA BIBLIOTECA
+# ============================================================
+
+COLUNAS_CANAIS = ['Nome', 'Inscritos', 'Vídeos', 'Média Views', 'País', 'Criação', 'Dias Vida', 'Link', 'Data Descoberta']
+INTEIROS_CANAIS = {'Inscritos', 'Vídeos', 'Média Views', 'Dias Vida'}
+COLUNAS_VIRAIS = ['Título', 'Canal', 'Views', 'Likes', 'Comentários', 'Publicado em', 'Link', 'Data Descoberta']
+INTEIROS_VIRAIS = {'Views', 'Likes', 'Comentários'}
+
+PARTICAO = 'Data Descoberta'
+
+def montar_esquema(colunas, inteiros):
+    return pa.schema([(c, pa.int64() if c in inteiros else pa.string()) for c in colunas])
+
+ESQUEMA_CANAIS = montar_esquema(COLUNAS_CANAIS, INTEIROS_CANAIS)
+ESQUEMA_VIRAIS = montar_esquema(COLUNAS_VIRAIS, INTEIROS_VIRAIS)
+
+
+# ============================================================
+# CONVERSÕES
+# ============================================================
+
+def para_tabela(df, esquema):
+    df = df.reindex(columns=esquema.names)
+    for campo in esquema:
+        if campo.type == pa.int64():
+            df[campo.name] = pd.to_numeric(df[campo.name], errors='coerce').astype('Int64')
+        else:
+            df[campo.name] = df[campo.name].astype('string')
+    # CSVs antigos podem trazer a data em branco; sem isso ela viraria a partição "Data Descoberta="
+    df[PARTICAO] = df[PARTICAO].str.strip().replace("", pd.NA).fillna("Desconhecida")
+    return pa.Table.from_pandas(df, schema=esquema, preserve_index=False)
+
+def para_dataframe(tabela):
+    return tabela.to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get)
+
+def ler_csv(arquivo, esquema):
+    # 'N/A' é um valor legítimo de País; sem keep_default_na ele viraria NaN
+    texto = {c.name: str for c in esquema if c.type == pa.string()}
+    df = pd.read_csv(arquivo, dtype=texto, keep_default_na=False, na_values={c: [''] for c in esquema.names if c not in texto})
+    return para_dataframe(para_tabela(df, esquema))
+
+
+# ============================================================
+# DATASET PARQUET (UM ARQUIVO POR DATA DESCOBERTA)
+# ============================================================
+
+def _dataset(diretorio, esquema):
+    particionamento = ds.partitioning(pa.schema([esquema.field(PARTICAO)]), flavor='hive')
+    return ds.dataset(diretorio, schema=esquema, format='parquet', partitioning=particionamento,
+                      filesystem=pafs.LocalFileSystem(use_mmap=True))
+
+def _arquivo_particao(diretorio, data):
+    return os.path.join(diretorio, f"{PARTICAO}={data}", "dados.parquet")
+
+def ler_parquet(diretorio, esquema):
+    if not os.path.exists(diretorio):
+        return para_dataframe(esquema.empty_table())
+    return para_dataframe(_dataset(diretorio, esquema).to_table())
+
+def links_parquet(diretorio, esquema):
+    if not os.path.exists(diretorio): return set()
+    return set(_dataset(diretorio, esquema).to_table(columns=['Link']).column('Link').to_pylist())
+
+def anexar_parquet(diretorio, esquema, df):
+    # Reescreve só o arquivo do dia afetado, mantendo uma partição compacta por data
+    tabela = para_tabela(df, esquema)
+    sem_particao = esquema.remove(esquema.get_field_index(PARTICAO))
+    for data in pc.unique(tabela.column(PARTICAO)).to_pylist():
+        novas = tabela.filter(pc.equal(tabela.column(PARTICAO), data)).drop_columns([PARTICAO])
+        arquivo = _arquivo_particao(diretorio, data)
+        os.makedirs(os.path.dirname(arquivo), exist_ok=True)
+        if os.path.exists(arquivo):
+            novas = pa.concat_tables([pq.read_table(arquivo, schema=sem_particao), novas])
+        temporario = os.path.join(os.path.dirname(arquivo), ".dados.parquet.tmp")  # ignorado pelo dataset
+        pq.write_table(novas, temporario)
+        os.replace(temporario, arquivo)
+
+def migrar_csv(arquivo_csv, diretorio, esquema):
+    # Recria o dataset a partir do CSV; repetir após uma falha não duplica linhas
+    limpar_parquet(diretorio)
+    if not os.path.exists(arquivo_csv): return
+    df = ler_csv(arquivo_csv, esquema)
+    if not df.empty: anexar_parquet(diretorio, esquema, df)
+
+def limpar_parquet(diretorio):
+    shutil.rmtree(diretorio, ignore_errors=True)
+    os.makedirs(diretorio, exist_ok=True)
+
+def assinatura(caminho):
+    # Muda sempre que o arquivo ou algum arquivo do dataset é reescrito; serve de chave de cache
+    if os.path.isfile(caminho):
+        return (caminho, os.stat(caminho).st_mtime_ns)
+    arquivos = []
+    for raiz, _, nomes in os.walk(caminho):
+        for nome in nomes:
+            info = os.stat(os.path.join(raiz, nome))
+            arquivos.append((os.path.join(raiz, nome), info.st_mtime_ns, info.st_size))
+    return tuple(sorted(arquivos))
@@ -0,0 +1,166 @@
+import json
+import os
+import sys
+import time
+
+import pandas as pd
+
+# ============================================================
+# ARMAZENAMENTO DE RESULTADOS DA SESSÃO
+# ============================================================
+
+CAMPOS_INTERNADOS = {'País', 'Criação', 'Data Descoberta', 'Canal', 'Publicado em'}
+
+class ResultadosSessao:
+    """Resultados guardados por coluna, com índice de Link para deduplicação O(1)."""
+    __slots__ = ('colunas', 'posicoes', 'versao', 'exportacoes')
+
+    def __init__(self):
+        self.colunas = {}
+        self.posicoes = {}
+        self.versao = 0
+        self.exportacoes = {}
+
+    def __len__(self):
+        return len(self.posicoes)
+
+    def __iter__(self):
+        nomes = list(self.colunas)
+        for valores in zip(*self.colunas.values()):
+            yield dict(zip(nomes, valores))
+
+    def adicionar(self, linhas):
+        novos = 0
+        for linha in linhas:
+            if linha['Link'] in self.posicoes: continue
+            n = len(self.posicoes)
+            self.posicoes[linha['Link']] = n
+            for campo, valor in linha.items():
+                coluna = self.colunas.get(campo)
+                if coluna is None:
+                    coluna = self.colunas[campo] = [None] * n
+                if campo in CAMPOS_INTERNADOS and isinstance(valor, str):
+                    valor = sys.intern(valor)
+                coluna.append(valor)
+            for coluna in self.colunas.values():
+                if len(coluna) == n: coluna.append(None)
+            novos += 1
+        if novos: self.versao += 1
+        return novos
+
+    def atualizar(self, linhas):
+        # Linhas já presentes recebem os valores mais recentes (ex.: consultas que as encontraram)
+        for linha in linhas:
+            posicao = self.posicoes.get(linha['Link'])
+            if posicao is None: continue
+            for campo, valor in linha.items():
+                if campo in self.colunas: self.colunas[campo][posicao] = valor
+            self.versao += 1
+
+    def limpar(self):
+        self.colunas.clear()
+        self.posicoes.clear()
+        self.versao += 1
+
+    def to_dataframe(self):
+        return pd.DataFrame(self.colunas).drop(columns=['Thumb'], errors='ignore')
+
+    def exportar(self, formato):
+        # Serializa só quando os resultados mudam, não a cada rerun da página
+        chave = (self.versao, formato)
+        if chave not in self.exportacoes:
+            df = self.to_dataframe()
+            dados = df.to_parquet(index=False) if formato == "parquet" else df.to_csv(index=False).encode('utf-8')
+            self.exportacoes = {k: v for k, v in self.exportacoes.items() if k[0] == self.versao}
+            self.exportacoes[chave] = dados
+        return self.exportacoes[chave]
+
+
+# ============================================================
+# ÍNDICE GLOBAL DE RESULTADOS (ENTRE BUSCAS)
+# ============================================================
+
+# Cada entrada é [atualizado, descoberto, consultas, valores], com valores na ordem de CAMPOS_INDICE
+CAMPOS_INDICE = {
+    'canais': ('Nome', 'Inscritos', 'Vídeos', 'Total Views', 'País', 'Criado', 'Thumb'),
+    'videos': ('Título', 'Canal', 'Views', 'Likes', 'Comentários', 'Publicado em')
+}
+
+def indice_vazio():
+    return {tipo: {} for tipo in CAMPOS_INDICE}
+
+def podar_indice(indice, retencao, agora=None):
+    limite = (agora or time.time()) - retencao
+    removidos = 0
+    for itens in indice.values():
+        for item_id in [i for i, entrada in itens.items() if entrada[0] < limite]:
+            del itens[item_id]
+            removidos += 1
+    return removidos
+
+def mesclar_indices(destino, origem):
+    # Mantém os valores mais recentes de cada item e une as consultas registradas dos dois lados
+    for tipo, itens in origem.items():
+        for item_id, entrada in itens.items():
+            atual = destino[tipo].get(item_id)
+            if atual is None:
+                destino[tipo][item_id] = entrada
+                continue
+            consultas = atual[2] + [q for q in entrada[2] if q not in atual[2]]
+            if entrada[0] > atual[0]:
+                atual[0], atual[3] = entrada[0], entrada[3]
+            atual[1] = min(atual[1], entrada[1])
+            atual[2] = consultas
+    return destino
+
+def salvar_indice(arquivo, indice):
+    temporario = arquivo + ".tmp"
+    with open(temporario, 'w', encoding='utf-8') as f:
+        for tipo, itens in indice.items():
+            for item_id, entrada in itens.items():
+                f.write(json.dumps([tipo, item_id, entrada], ensure_ascii=False) + "\n")
+    os.replace(temporario, arquivo)
+
+def carregar_indice(arquivo, retencao):
+    indice = indice_vazio()
+    if not os.path.exists(arquivo):
+        return indice
+    with open(arquivo, encoding='utf-8', errors='replace') as f:
+        for linha in f:
+            # Linhas truncadas (ex.: queda no meio de um append) são descartadas uma a uma
+            try:
+                tipo, item_id, entrada = json.loads(linha)
+                itens = indice[tipo]
+                if entrada is None: itens.pop(item_id, None)
+                elif len(entrada) == 4: itens[item_id] = entrada
+            except (ValueError, TypeError, KeyError):
+                continue
+    podar_indice(indice, retencao)
+    # Compacta o diário uma vez por carga; depois disso cada busca só acrescenta linhas
+    salvar_indice(arquivo, indice)
+    return indice
+
+def anotar_indice(arquivo, tipo, alterados):
+    with open(arquivo, 'a', encoding='utf-8') as f:
+        for item_id, entrada in alterados.items():
+            f.write(json.dumps([tipo, item_id, entrada], ensure_ascii=False) + "\n")
+
+def ids_pendentes(indice, ids, validade, agora=None):
+    agora = agora or time.time()
+    return [i for i in ids if i not in indice or agora - indice[i][0] > validade]
+
+def registrar_no_indice(indice, item_id, valores, hoje):
+    entrada = indice.get(item_id)
+    if entrada is None:
+        entrada = indice[item_id] = [0, hoje, [], None]
+    entrada[0] = time.time()
+    entrada[3] = valores
+    return entrada
+
+def registrar_consulta(entrada, query):
+    if query in entrada[2]: return False
+    entrada[2].append(query)
+    return True
+
+def dados_indice(tipo, entrada):
+    return dict(zip(CAMPOS_INDICE[tipo], entrada[3]))
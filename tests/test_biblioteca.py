@@ -0,0 +1,87 @@
+import os
+
+import pandas as pd
+
+from biblioteca import (
+    COLUNAS_CANAIS, ESQUEMA_CANAIS, anexar_parquet, assinatura, ler_parquet, limpar_parquet, links_parquet,
+    migrar_csv
+)
+
+
+def canal(link, pais, data="2026-10-19"):
+    return {
+        'Nome': f"Canal {link}", 'Inscritos': 1500, 'Vídeos': 12, 'Média Views': 3000, 'País': pais,
+        'Criação': "01/01/2026", 'Dias Vida': 40, 'Link': link, 'Data Descoberta': data
+    }
+
+
+def test_importar_csv_com_pais_na_e_anexar_outro_pais(tmp_path):
+    arquivo_csv = tmp_path / "canais_salvos.csv"
+    diretorio = tmp_path / "canais_salvos_parquet"
+    pd.DataFrame([canal("a", "N/A"), canal("b", "N/A")], columns=COLUNAS_CANAIS).to_csv(arquivo_csv, index=False)
+
+    migrar_csv(str(arquivo_csv), str(diretorio), ESQUEMA_CANAIS)
+    anexar_parquet(str(diretorio), ESQUEMA_CANAIS, pd.DataFrame([canal("c", "BR")]))
+
+    df = ler_parquet(str(diretorio), ESQUEMA_CANAIS).sort_values('Link')
+    assert list(df['País']) == ["N/A", "N/A", "BR"]
+    assert str(df['Inscritos'].dtype) == "Int64"
+    assert links_parquet(str(diretorio), ESQUEMA_CANAIS) == {"a", "b", "c"}
+
+
+def test_migrar_de_novo_nao_duplica_linhas(tmp_path):
+    arquivo_csv = tmp_path / "canais_salvos.csv"
+    diretorio = tmp_path / "canais_salvos_parquet"
+    pd.DataFrame([canal("a", "BR")], columns=COLUNAS_CANAIS).to_csv(arquivo_csv, index=False)
+
+    migrar_csv(str(arquivo_csv), str(diretorio), ESQUEMA_CANAIS)
+    migrar_csv(str(arquivo_csv), str(diretorio), ESQUEMA_CANAIS)
+
+    assert len(ler_parquet(str(diretorio), ESQUEMA_CANAIS)) == 1
+
+
+def test_data_descoberta_em_branco_vai_para_particao_desconhecida(tmp_path):
+    arquivo_csv = tmp_path / "canais_salvos.csv"
+    diretorio = tmp_path / "canais_salvos_parquet"
+    pd.DataFrame([canal("a", "BR", data="")], columns=COLUNAS_CANAIS).to_csv(arquivo_csv, index=False)
+
+    migrar_csv(str(arquivo_csv), str(diretorio), ESQUEMA_CANAIS)
+
+    assert os.listdir(diretorio) == ["Data Descoberta=Desconhecida"]
+    assert list(ler_parquet(str(diretorio), ESQUEMA_CANAIS)['Data Descoberta']) == ["Desconhecida"]
+
+
+def test_anexar_mantem_um_arquivo_por_data(tmp_path):
+    diretorio = tmp_path / "canais_salvos_parquet"
+    for link in ["a", "b", "c"]:
+        anexar_parquet(str(diretorio), ESQUEMA_CANAIS, pd.DataFrame([canal(link, "BR")]))
+    anexar_parquet(str(diretorio), ESQUEMA_CANAIS, pd.DataFrame([canal("d", "US", data="2026-10-20")]))
+
+    arquivos = sorted(os.path.relpath(os.path.join(raiz, nome), diretorio)
+                      for raiz, _, nomes in os.walk(diretorio) for nome in nomes)
+    assert arquivos == [
+        os.path.join("Data Descoberta=2026-10-19", "dados.parquet"),
+        os.path.join("Data Descoberta=2026-10-20", "dados.parquet"),
+    ]
+    assert len(ler_parquet(str(diretorio), ESQUEMA_CANAIS)) == 4
+
+
+def test_assinatura_muda_quando_a_particao_e_reescrita(tmp_path):
+    diretorio = tmp_path / "canais_salvos_parquet"
+    anexar_parquet(str(diretorio), ESQUEMA_CANAIS, pd.DataFrame([canal("a", "BR")]))
+    antes = assinatura(str(diretorio))
+
+    anexar_parquet(str(diretorio), ESQUEMA_CANAIS, pd.DataFrame([canal("b", "BR")]))
+
+    assert assinatura(str(diretorio)) != antes
+
+
+def test_limpar_mantem_biblioteca_vazia_em_parquet(tmp_path):
+    diretorio = tmp_path / "canais_salvos_parquet"
+    anexar_parquet(str(diretorio), ESQUEMA_CANAIS, pd.DataFrame([canal("a", "BR")]))
+
+    limpar_parquet(str(diretorio))
+
+    assert diretorio.is_dir()
+    df = ler_parquet(str(diretorio), ESQUEMA_CANAIS)
+    assert df.empty and list(df.columns) == COLUNAS_CANAIS
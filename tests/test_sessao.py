@@ -0,0 +1,130 @@
+import json
+import time
+
+from sessao import (
+    ResultadosSessao, anotar_indice, carregar_indice, ids_pendentes, indice_vazio, mesclar_indices,
+    podar_indice, registrar_consulta, registrar_no_indice
+)
+
+
+def canal(link, **extra):
+    return {'Nome': f"Canal {link}", 'Inscritos': 1500, 'País': "BR", 'Link': link, **extra}
+
+
+def test_adicionar_ignora_links_repetidos():
+    resultados = ResultadosSessao()
+
+    assert resultados.adicionar([canal("a"), canal("b"), canal("a")]) == 2
+    assert resultados.adicionar([canal("b"), canal("c")]) == 1
+    assert [linha['Link'] for linha in resultados] == ["a", "b", "c"]
+
+
+def test_atualizar_so_altera_linhas_existentes():
+    resultados = ResultadosSessao()
+    resultados.adicionar([canal("a", Consultas="q1")])
+
+    resultados.atualizar([canal("a", Consultas="q1, q2"), canal("z", Consultas="q2")])
+
+    assert len(resultados) == 1
+    assert list(resultados) == [canal("a", Consultas="q1, q2")]
+
+
+def test_campos_novos_preenchem_linhas_anteriores_com_none():
+    resultados = ResultadosSessao()
+    resultados.adicionar([canal("a")])
+    resultados.adicionar([canal("b", Consultas="q1")])
+
+    assert [linha['Consultas'] for linha in resultados] == [None, "q1"]
+
+
+def test_exportar_reaproveita_bytes_ate_os_resultados_mudarem():
+    resultados = ResultadosSessao()
+    resultados.adicionar([canal("a")])
+    primeiro = resultados.exportar("csv")
+
+    assert resultados.exportar("csv") is primeiro
+    resultados.adicionar([canal("b")])
+    assert resultados.exportar("csv") is not primeiro
+    assert b"Canal b" in resultados.exportar("csv")
+
+
+# ============================================================
+# ÍNDICE GLOBAL
+# ============================================================
+
+RETENCAO = 7 * 24 * 60 * 60
+
+
+def entrada(atualizado, consultas=()):
+    return [atualizado, "2026-10-19", list(consultas), ["Canal", 1, 2, 3, "BR", "2020-01-01", ""]]
+
+
+def test_diario_reaplica_remocoes_e_compacta(tmp_path):
+    arquivo = str(tmp_path / "indice.jsonl")
+    agora = time.time()
+    anotar_indice(arquivo, 'canais', {'a': entrada(agora, ["q1"]), 'b': entrada(agora)})
+    anotar_indice(arquivo, 'canais', {'a': None})
+    anotar_indice(arquivo, 'videos', {'v': entrada(agora)})
+
+    indice = carregar_indice(arquivo, RETENCAO)
+
+    assert set(indice['canais']) == {'b'} and set(indice['videos']) == {'v'}
+    assert len(open(arquivo, encoding='utf-8').readlines()) == 2
+
+
+def test_linha_truncada_nao_descarta_o_resto_do_diario(tmp_path):
+    arquivo = str(tmp_path / "indice.jsonl")
+    agora = time.time()
+    anotar_indice(arquivo, 'canais', {str(i): entrada(agora) for i in range(5)})
+    with open(arquivo, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(['canais', 'x', entrada(agora)])[:20])
+
+    indice = carregar_indice(arquivo, RETENCAO)
+
+    assert set(indice['canais']) == {"0", "1", "2", "3", "4"}
+    assert all(json.loads(linha) for linha in open(arquivo, encoding='utf-8'))
+    assert len(carregar_indice(arquivo, RETENCAO)['canais']) == 5
+
+
+def test_podar_remove_itens_antigos():
+    agora = time.time()
+    indice = indice_vazio()
+    indice['canais'] = {'novo': entrada(agora), 'velho': entrada(agora - RETENCAO - 1)}
+
+    assert podar_indice(indice, RETENCAO, agora) == 1
+    assert set(indice['canais']) == {'novo'}
+
+
+def test_carregar_descarta_itens_fora_da_retencao(tmp_path):
+    arquivo = str(tmp_path / "indice.jsonl")
+    anotar_indice(arquivo, 'canais', {'velho': entrada(time.time() - RETENCAO - 1)})
+
+    assert carregar_indice(arquivo, RETENCAO)['canais'] == {}
+
+
+def test_mesclar_une_consultas_e_mantem_valores_recentes():
+    disco, sessao = indice_vazio(), indice_vazio()
+    disco['canais']['a'] = entrada(100, ["q1", "q2"])
+    sessao['canais']['a'] = entrada(200, ["q2", "q3"])
+    sessao['canais']['a'][3] = ["Novo", 9, 9, 9, "US", "2020-01-01", ""]
+
+    mesclar_indices(disco, sessao)
+
+    assert disco['canais']['a'][0] == 200
+    assert disco['canais']['a'][2] == ["q1", "q2", "q3"]
+    assert disco['canais']['a'][3][0] == "Novo"
+
+
+def test_ids_pendentes_respeita_validade():
+    agora = time.time()
+    indice = {'fresco': entrada(agora), 'vencido': entrada(agora - 100)}
+
+    assert ids_pendentes(indice, ['fresco', 'vencido', 'novo'], 60, agora) == ['vencido', 'novo']
+
+
+def test_registrar_consulta_sem_repetir():
+    indice = {}
+    item = registrar_no_indice(indice, 'a', ["Canal"], "2026-10-19")
+
+    assert registrar_consulta(item, "q1") and not registrar_consulta(item, "q1")
+    assert registrar_no_indice(indice, 'a', ["Outro"], "2026-10-20")[1:3] == ["2026-10-19", ["q1"]]